@@ -9,10 +9,16 @@ import streamlit as st
 import pandas as pd
 import plotly.express as px
 import plotly.graph_objects as go
+import plotly.io as pio
 from plotly.subplots import make_subplots
 import numpy as np
+import os
 from datetime import datetime
 
+# The loaded and filtered frames are shared across reruns and sessions (st.cache_resource);
+# copy-on-write guarantees any derived frame that gets modified copies instead of mutating them
+pd.options.mode.copy_on_write = True
+
 # ============================================================================
 # PAGE CONFIGURATION
 # ============================================================================
@@ -90,14 +96,52 @@ st.markdown("""
 # ============================================================================
 # DATA LOADING AND PREPROCESSING
 # ============================================================================
-@st.cache_data
+# Raw dataset and the optional columnar copy written by convert_to_parquet.py
+CSV_PATH = 'skill_half_life_ai.csv'
+PARQUET_PATH = 'skill_half_life_ai.parquet'
+
+# Urgency tiers ordered from most to least urgent; 'Critical (<2y)' has code 0
+URGENCY_LEVELS = ['Critical (<2y)', 'High (2-5y)', 'Moderate (5-10y)', 'Low (>10y)']
+URGENCY_DTYPE = pd.CategoricalDtype(URGENCY_LEVELS, ordered=True)
+
+# Upper bound on markers sent to the browser by point-cloud charts (3.2, 3.6)
+MAX_PLOT_POINTS = 2000
+
+# Context columns shown on hover in point-cloud charts, when present in the dataset
+HOVER_COLUMNS = ['Sector', 'Skill_Category', 'Year']
+
+def parquet_is_stale():
+    """
+    Return True when the Parquet copy exists but the CSV has been modified since it was written.
+    """
+    return (
+        os.path.exists(PARQUET_PATH)
+        and os.path.exists(CSV_PATH)
+        and os.path.getmtime(CSV_PATH) > os.path.getmtime(PARQUET_PATH)
+    )
+
+@st.cache_resource
 def load_and_process_data():
     """
     Load dataset and perform feature engineering for analytical depth.
-    Returns processed dataframe with derived metrics.
+    Returns the processed dataframe with derived metrics, a frozenset of its column names,
+    and the sorted sector and skill category option tuples used by the sidebar filters.
+    Cached as a shared resource, so every caller receives the same (read-only) frame
+    instead of an unpickled copy.
     """
     try:
-        df = pd.read_csv('skill_half_life_ai.csv')
+        # Prefer the columnar copy produced by convert_to_parquet.py unless the CSV has been
+        # updated since the conversion; a stale copy must never serve old data.
+        # Both paths load Arrow-backed columns (multithreaded C++ parsing, contiguous string buffers).
+        if os.path.exists(PARQUET_PATH) and not parquet_is_stale():
+            df = pd.read_parquet(PARQUET_PATH, dtype_backend='pyarrow')
+        else:
+            df = pd.read_csv(CSV_PATH, engine='pyarrow', dtype_backend='pyarrow')
+        
+        # Low-cardinality labels used for filtering, grouping and coloring
+        for col in ('Sector', 'Industry', 'Skill_Category'):
+            if col in df.columns:
+                df[col] = df[col].astype('category')
         
         # Feature engineering: Derive analytical metrics
         if 'AI_Adoption_Rate' in df.columns and 'Skill_Depreciation_Rate' in df.columns:
@@ -107,20 +151,396 @@ def load_and_process_data():
             df['Urgency_Category'] = pd.cut(
                 df['Years_to_50_Percent_Obsolescence'], 
                 bins=[0, 2, 5, 10, np.inf],
-                labels=['Critical (<2y)', 'High (2-5y)', 'Moderate (5-10y)', 'Low (>10y)']
-            )
+                labels=URGENCY_LEVELS
+            ).astype(URGENCY_DTYPE)
         
         if 'Reskilling_Time_Months' in df.columns and 'Years_to_50_Percent_Obsolescence' in df.columns:
             df['Reskilling_Viability_Ratio'] = (
                 df['Years_to_50_Percent_Obsolescence'] * 12
             ) / df['Reskilling_Time_Months']
         
-        return df
+        # Sidebar filter options are constant for the session; compute them once here
+        sector_options = ()
+        if 'Sector' in df.columns or 'Industry' in df.columns:
+            sector_col = 'Sector' if 'Sector' in df.columns else 'Industry'
+            sector_options = tuple(sorted(df[sector_col].cat.categories.tolist()))
+        
+        category_options = ()
+        if 'Skill_Category' in df.columns:
+            category_options = tuple(sorted(df['Skill_Category'].cat.categories.tolist()))
+        
+        schema = frozenset(df.columns)
+        
+        return df, schema, sector_options, category_options
     except FileNotFoundError:
-        st.error("Dataset 'skill_half_life_ai.csv' not found. Please ensure the file is in the same directory.")
+        st.error(f"Dataset not found: neither '{PARQUET_PATH}' nor '{CSV_PATH}' exists. "
+                 "Please ensure the file is in the same directory.")
         st.stop()
 
-df = load_and_process_data()
+@st.cache_resource
+def get_filtered(selected_sector, selected_category):
+    """
+    Return the subset of the dataset matching the sidebar selection.
+    Memoized on the (sector, category) pair as a shared resource, so repeated reruns skip
+    both the masking pass and any copy of the frame; callers must treat it as read-only.
+    """
+    df, schema, _, _ = load_and_process_data()
+    if selected_sector == 'All' and selected_category == 'All':
+        return df
+    
+    mask = pd.Series(True, index=df.index)
+    
+    if selected_sector != 'All':
+        sector_col = 'Sector' if 'Sector' in schema else 'Industry'
+        mask &= df[sector_col] == selected_sector
+    
+    if selected_category != 'All':
+        mask &= df['Skill_Category'] == selected_category
+    
+    return df.loc[mask]
+
+@st.cache_data
+def compute_urgency_counts(selected_sector, selected_category):
+    """
+    Count skills per urgency tier for the given filter selection.
+    """
+    df_filtered = get_filtered(selected_sector, selected_category)
+    urgency_counts = df_filtered['Urgency_Category'].value_counts().reset_index()
+    urgency_counts.columns = ['Urgency_Category', 'Count']
+    return urgency_counts
+
+@st.cache_data
+def compute_viability_by_category(selected_sector, selected_category):
+    """
+    Aggregate mean reskilling viability, duration and half-life per skill domain.
+    """
+    df_filtered = get_filtered(selected_sector, selected_category)
+    return df_filtered.groupby('Skill_Category', observed=True).agg({
+        'Reskilling_Viability_Ratio': 'mean',
+        'Reskilling_Time_Months': 'mean',
+        'Years_to_50_Percent_Obsolescence': 'mean'
+    }).reset_index()
+
+@st.cache_data
+def compute_temporal_trend(selected_sector, selected_category):
+    """
+    Aggregate yearly mean, median and standard deviation of skill half-life.
+    """
+    df_filtered = get_filtered(selected_sector, selected_category)
+    temporal_trend = df_filtered.groupby('Year').agg({
+        'Years_to_50_Percent_Obsolescence': ['mean', 'median', 'std']
+    }).reset_index()
+    temporal_trend.columns = ['Year', 'Mean', 'Median', 'Std']
+    return temporal_trend
+
+@st.cache_data
+def compute_half_life_quartiles(selected_sector, selected_category):
+    """
+    Summarize skill half-life per skill domain for box plot rendering.
+    Returns quartiles, Tukey fences (most extreme values within 1.5 IQR of the quartiles)
+    and the list of observations outside the fences. Quartiles use numpy's 'hazen' method,
+    which matches plotly.js quartilemethod='linear' so the boxes equal what px.box drew.
+    """
+    df_filtered = get_filtered(selected_sector, selected_category)
+    rows = []
+    for category, values in df_filtered.groupby('Skill_Category', observed=True)['Years_to_50_Percent_Obsolescence']:
+        values = values.dropna().to_numpy(dtype=float)
+        if values.size == 0:
+            continue
+        q1, median, q3 = np.quantile(values, [0.25, 0.5, 0.75], method='hazen')
+        iqr = q3 - q1
+        inside = (values >= q1 - 1.5 * iqr) & (values <= q3 + 1.5 * iqr)
+        rows.append({
+            'Skill_Category': category,
+            'q1': q1,
+            'median': median,
+            'q3': q3,
+            'lowerfence': values[inside].min(),
+            'upperfence': values[inside].max(),
+            'outliers': values[~inside].tolist()
+        })
+    return pd.DataFrame(rows, columns=['Skill_Category', 'q1', 'median', 'q3', 'lowerfence', 'upperfence', 'outliers'])
+
+@st.cache_data
+def compute_adoption_statistics(selected_sector, selected_category):
+    """
+    Fit a least-squares line of depreciation rate on AI adoption rate.
+    Returns (slope, intercept, x_min, x_max, correlation). Rows missing either value are
+    excluded, and the fit is NaN when fewer than two distinct adoption rates remain.
+    """
+    df_filtered = get_filtered(selected_sector, selected_category)
+    x = df_filtered['AI_Adoption_Rate'].to_numpy(dtype=float, na_value=np.nan)
+    y = df_filtered['Skill_Depreciation_Rate'].to_numpy(dtype=float, na_value=np.nan)
+    valid = np.isfinite(x) & np.isfinite(y)
+    x, y = x[valid], y[valid]
+    
+    slope = intercept = x_min = x_max = np.nan
+    if np.unique(x).size >= 2:
+        slope, intercept = np.polyfit(x, y, 1)
+        x_min, x_max = x.min(), x.max()
+    
+    correlation = df_filtered['AI_Adoption_Rate'].corr(df_filtered['Skill_Depreciation_Rate'])
+    return slope, intercept, x_min, x_max, correlation
+
+def downsample_for_plot(df_plot, plotted_columns, max_points=MAX_PLOT_POINTS):
+    """
+    Return at most max_points complete rows for point-cloud rendering, as numpy dtypes.
+    Rows missing any plotted coordinate or marker size are dropped first. Uses a fixed-seed
+    sample so the chart is stable across reruns; statistics are still computed on the full
+    selection. The remaining Arrow columns (colour, hover name, hover data) are converted
+    with NaN for missing values, since plotly can neither group nor serialize Arrow <NA>.
+    """
+    df_plot = df_plot.dropna(subset=[col for col in plotted_columns if col in df_plot.columns])
+    if len(df_plot) > max_points:
+        df_plot = df_plot.sample(n=max_points, random_state=42)
+    converted = {}
+    for col, dtype in df_plot.dtypes.items():
+        if isinstance(dtype, pd.CategoricalDtype):
+            # Loaded categoricals keep Arrow-typed categories; rebuild them on object categories
+            categories = dtype.categories.to_numpy(dtype=object)
+            converted[col] = pd.Categorical(df_plot[col].to_numpy(dtype=object, na_value=np.nan),
+                                            categories=categories, ordered=dtype.ordered)
+        elif isinstance(dtype, pd.ArrowDtype) and pd.api.types.is_integer_dtype(dtype) and df_plot[col].hasnans:
+            converted[col] = df_plot[col].to_numpy(dtype=float, na_value=np.nan)
+        elif isinstance(dtype, pd.ArrowDtype) and pd.api.types.is_numeric_dtype(dtype):
+            converted[col] = df_plot[col].to_numpy(dtype=dtype.numpy_dtype, na_value=np.nan)
+        elif isinstance(dtype, pd.ArrowDtype):
+            converted[col] = df_plot[col].to_numpy(dtype=object, na_value=np.nan)
+        else:
+            converted[col] = df_plot[col]
+    return pd.DataFrame(converted, index=df_plot.index)
+
+# Column availability is probed once here; every optional-column check below branches on schema
+df, schema, sector_options, category_options = load_and_process_data()
+
+# Warned here rather than inside the cached loader, whose messages every nested cached caller replays
+if parquet_is_stale():
+    st.warning(f"'{PARQUET_PATH}' is older than '{CSV_PATH}'. The CSV is used whenever the data is loaded, "
+               "but data already cached by this server is not reloaded: re-run convert_to_parquet.py, "
+               "then restart the app or clear the cache.")
+
+# ============================================================================
+# FIGURE BUILDERS
+# ============================================================================
+# Each builder is memoized on the filter selection and returns the serialized
+# figure, so identical selections skip figure construction and JSON encoding.
+@st.cache_data
+def build_half_life_distribution_figure(selected_sector, selected_category):
+    """
+    Box plot of skill half-life per skill domain (Visualization 3.1).
+    """
+    half_life_quartiles = compute_half_life_quartiles(selected_sector, selected_category)
+    palette = px.colors.qualitative.Bold
+    
+    # Quartiles and fences are precomputed, so the browser receives one summary per domain
+    fig1 = go.Figure()
+    for i, row in enumerate(half_life_quartiles.itertuples(index=False)):
+        color = palette[i % len(palette)]
+        fig1.add_trace(go.Box(
+            x=[row.Skill_Category],
+            q1=[row.q1],
+            median=[row.median],
+            q3=[row.q3],
+            lowerfence=[row.lowerfence],
+            upperfence=[row.upperfence],
+            name=row.Skill_Category,
+            marker_color=color
+        ))
+        if row.outliers:
+            fig1.add_trace(go.Scatter(
+                x=[row.Skill_Category] * len(row.outliers),
+                y=row.outliers,
+                mode='markers',
+                name=row.Skill_Category,
+                marker=dict(color=color)
+            ))
+    
+    fig1.update_layout(
+        title="Skill Half-Life Distribution Across Domains",
+        xaxis_title="Skill Domain",
+        yaxis_title="Years to 50% Obsolescence",
+        template='plotly_dark',
+        showlegend=False,
+        height=500,
+        xaxis_tickangle=-45,
+        title_font_size=18,
+        font=dict(size=12)
+    )
+    fig1.add_hline(y=5, line_dash="dash", line_color="red", 
+                   annotation_text="Critical Threshold (5 years)", annotation_position="right")
+    return fig1.to_json()
+
+@st.cache_data
+def build_adoption_impact_figure(selected_sector, selected_category):
+    """
+    Scatter of AI adoption against skill depreciation with a fitted trendline (Visualization 3.2).
+    """
+    df_filtered = get_filtered(selected_sector, selected_category)
+    
+    # Color by sector or category if available
+    color_col = None
+    if 'Sector' in schema:
+        color_col = 'Sector'
+    elif 'Skill_Category' in schema:
+        color_col = 'Skill_Category'
+    
+    fig2 = px.scatter(
+        downsample_for_plot(df_filtered, ['AI_Adoption_Rate', 'Skill_Depreciation_Rate', 'Acceleration_Index']),
+        x='AI_Adoption_Rate',
+        y='Skill_Depreciation_Rate',
+        color=color_col,
+        size='Acceleration_Index' if 'Acceleration_Index' in schema else None,
+        hover_name='Skill_Name' if 'Skill_Name' in schema else None,
+        hover_data=[col for col in HOVER_COLUMNS if col in schema],
+        color_discrete_sequence=px.colors.qualitative.Vivid,
+        title="AI Adoption Rate vs. Skill Depreciation Dynamics",
+        labels={'AI_Adoption_Rate': 'AI Adoption Rate (%)', 'Skill_Depreciation_Rate': 'Skill Depreciation Rate'},
+        template='plotly_dark'
+    )
+    
+    # Overlay a single least-squares trendline fitted on the full selection
+    slope, intercept, x_min, x_max, _ = compute_adoption_statistics(selected_sector, selected_category)
+    if not np.isnan(slope):
+        fig2.add_trace(go.Scatter(
+            x=[x_min, x_max],
+            y=[slope * x_min + intercept, slope * x_max + intercept],
+            mode='lines',
+            name='OLS Trendline',
+            line=dict(color='white', width=2, dash='dash')
+        ))
+    fig2.update_layout(height=550, title_font_size=18)
+    return fig2.to_json()
+
+@st.cache_data
+def build_urgency_figure(selected_sector, selected_category):
+    """
+    Bar chart of skill counts per urgency tier (Visualization 3.3).
+    """
+    urgency_counts = compute_urgency_counts(selected_sector, selected_category)
+    
+    # Define color mapping for urgency
+    color_map = {
+        'Critical (<2y)': '#f44336',
+        'High (2-5y)': '#ff9800',
+        'Moderate (5-10y)': '#ffc107',
+        'Low (>10y)': '#4caf50'
+    }
+    
+    fig3 = px.bar(
+        urgency_counts,
+        x='Urgency_Category',
+        y='Count',
+        color='Urgency_Category',
+        color_discrete_map=color_map,
+        title="Distribution of Skill Obsolescence Urgency",
+        labels={'Urgency_Category': 'Urgency Level', 'Count': 'Number of Skills'},
+        template='plotly_dark',
+        text='Count'
+    )
+    fig3.update_layout(showlegend=False, height=450, title_font_size=18)
+    fig3.update_traces(textposition='outside')
+    return fig3.to_json()
+
+@st.cache_data
+def build_viability_figure(selected_sector, selected_category):
+    """
+    Bar chart of mean reskilling viability ratio per skill domain (Visualization 3.4).
+    """
+    viability_by_category = compute_viability_by_category(selected_sector, selected_category)
+    
+    fig4 = px.bar(
+        viability_by_category,
+        x='Skill_Category',
+        y='Reskilling_Viability_Ratio',
+        color='Reskilling_Viability_Ratio',
+        color_continuous_scale='RdYlGn',
+        title="Reskilling Viability Ratio by Skill Domain",
+        labels={'Reskilling_Viability_Ratio': 'Viability Ratio', 'Skill_Category': 'Skill Domain'},
+        template='plotly_dark',
+        text='Reskilling_Viability_Ratio'
+    )
+    fig4.update_traces(texttemplate='%{text:.2f}', textposition='outside')
+    fig4.update_layout(height=500, title_font_size=18, xaxis_tickangle=-45)
+    fig4.add_hline(y=1, line_dash="dash", line_color="white", 
+                   annotation_text="Viability Threshold (Ratio=1)", annotation_position="right")
+    return fig4.to_json()
+
+@st.cache_data
+def build_temporal_trend_figure(selected_sector, selected_category):
+    """
+    Line chart of yearly mean and median skill half-life (Visualization 3.5).
+    """
+    temporal_trend = compute_temporal_trend(selected_sector, selected_category)
+    
+    fig5 = go.Figure()
+    fig5.add_trace(go.Scatter(
+        x=temporal_trend['Year'], 
+        y=temporal_trend['Mean'],
+        mode='lines+markers',
+        name='Mean Half-Life',
+        line=dict(color='#64b5f6', width=3),
+        marker=dict(size=8)
+    ))
+    fig5.add_trace(go.Scatter(
+        x=temporal_trend['Year'], 
+        y=temporal_trend['Median'],
+        mode='lines+markers',
+        name='Median Half-Life',
+        line=dict(color='#81c784', width=3, dash='dash'),
+        marker=dict(size=8)
+    ))
+    
+    fig5.update_layout(
+        title="Skill Half-Life Trends Over Time",
+        xaxis_title="Year",
+        yaxis_title="Years to 50% Obsolescence",
+        template='plotly_dark',
+        height=500,
+        title_font_size=18,
+        hovermode='x unified'
+    )
+    return fig5.to_json()
+
+@st.cache_data
+def build_risk_profile_figure(selected_sector, selected_category):
+    """
+    3D scatter of AI adoption, depreciation rate and reskilling time (Visualization 3.6).
+    """
+    df_filtered = get_filtered(selected_sector, selected_category)
+    fig6 = px.scatter_3d(
+        downsample_for_plot(df_filtered, ['AI_Adoption_Rate', 'Skill_Depreciation_Rate', 'Reskilling_Time_Months']),
+        x='AI_Adoption_Rate',
+        y='Skill_Depreciation_Rate',
+        z='Reskilling_Time_Months',
+        color='Urgency_Category' if 'Urgency_Category' in schema else None,
+        hover_name='Skill_Name' if 'Skill_Name' in schema else None,
+        hover_data=[col for col in HOVER_COLUMNS if col in schema],
+        color_discrete_sequence=px.colors.qualitative.Bold,
+        title="3D Risk Topology: AI Adoption × Depreciation × Reskilling Burden",
+        labels={
+            'AI_Adoption_Rate': 'AI Adoption Rate (%)',
+            'Skill_Depreciation_Rate': 'Depreciation Rate',
+            'Reskilling_Time_Months': 'Reskilling Time (months)'
+        },
+        template='plotly_dark'
+    )
+    fig6.update_layout(height=700, title_font_size=18)
+    return fig6.to_json()
+
+def get_figure(builder, filter_key):
+    """
+    Return the figure produced by builder for the current filter selection.
+    Rehydrated figures are held in session state and reused until the selection changes,
+    so reruns with an unchanged selection skip JSON parsing and figure validation.
+    """
+    if st.session_state.get('figure_filter_key') != filter_key:
+        st.session_state['figure_filter_key'] = filter_key
+        st.session_state['figures'] = {}
+    
+    figures = st.session_state['figures']
+    if builder.__name__ not in figures:
+        figures[builder.__name__] = pio.from_json(builder(*filter_key))
+    return figures[builder.__name__]
 
 # ============================================================================
 # SIDEBAR CONTROLS
@@ -129,25 +549,19 @@ st.sidebar.title("Dashboard Controls")
 st.sidebar.markdown("---")
 
 # Filter by sector/industry if available
-if 'Sector' in df.columns or 'Industry' in df.columns:
-    sector_col = 'Sector' if 'Sector' in df.columns else 'Industry'
-    sectors = ['All'] + sorted(df[sector_col].unique().tolist())
+selected_sector = 'All'
+if 'Sector' in schema or 'Industry' in schema:
+    sectors = ['All'] + list(sector_options)
     selected_sector = st.sidebar.selectbox("Filter by Sector", sectors)
-    
-    if selected_sector != 'All':
-        df_filtered = df[df[sector_col] == selected_sector]
-    else:
-        df_filtered = df.copy()
-else:
-    df_filtered = df.copy()
 
 # Filter by skill category if available
-if 'Skill_Category' in df.columns:
-    categories = ['All'] + sorted(df['Skill_Category'].unique().tolist())
+selected_category = 'All'
+if 'Skill_Category' in schema:
+    categories = ['All'] + list(category_options)
     selected_category = st.sidebar.selectbox("Filter by Skill Category", categories)
-    
-    if selected_category != 'All':
-        df_filtered = df_filtered[df_filtered['Skill_Category'] == selected_category]
+
+filter_key = (selected_sector, selected_category)
+df_filtered = get_filtered(*filter_key)
 
 st.sidebar.markdown("---")
 st.sidebar.info(f"**Active Filters:** {len(df_filtered)} of {len(df)} records")
@@ -216,8 +630,9 @@ st.markdown('<p class="section-header">2. Key Research Performance Indicators</p
 col1, col2, col3, col4 = st.columns(4)
 
 # KPI 1: Median Skill Half-Life
-if 'Years_to_50_Percent_Obsolescence' in df_filtered.columns:
-    median_half_life = df_filtered['Years_to_50_Percent_Obsolescence'].median()
+if 'Years_to_50_Percent_Obsolescence' in schema:
+    half_life = df_filtered['Years_to_50_Percent_Obsolescence'].to_numpy(dtype=float, na_value=np.nan)
+    median_half_life = np.nanmedian(half_life) if half_life.size else np.nan
     col1.metric(
         label="Median Skill Half-Life",
         value=f"{median_half_life:.1f} years",
@@ -226,8 +641,9 @@ if 'Years_to_50_Percent_Obsolescence' in df_filtered.columns:
     )
 
 # KPI 2: Critical Skills Percentage
-if 'Urgency_Category' in df_filtered.columns:
-    critical_pct = (df_filtered['Urgency_Category'] == 'Critical (<2y)').sum() / len(df_filtered) * 100
+if 'Urgency_Category' in schema:
+    urgency_codes = df_filtered['Urgency_Category'].cat.codes.to_numpy()
+    critical_pct = np.count_nonzero(urgency_codes == 0) * 100.0 / urgency_codes.size if urgency_codes.size else np.nan
     col2.metric(
         label="Critical Skills",
         value=f"{critical_pct:.1f}%",
@@ -236,8 +652,9 @@ if 'Urgency_Category' in df_filtered.columns:
     )
 
 # KPI 3: Average Reskilling Time
-if 'Reskilling_Time_Months' in df_filtered.columns:
-    avg_reskilling = df_filtered['Reskilling_Time_Months'].mean()
+if 'Reskilling_Time_Months' in schema:
+    reskilling_months = df_filtered['Reskilling_Time_Months'].to_numpy(dtype=float, na_value=np.nan)
+    avg_reskilling = np.nanmean(reskilling_months) if reskilling_months.size else np.nan
     col3.metric(
         label="Avg Reskilling Duration",
         value=f"{avg_reskilling:.0f} months",
@@ -246,8 +663,9 @@ if 'Reskilling_Time_Months' in df_filtered.columns:
     )
 
 # KPI 4: Reskilling Viability
-if 'Reskilling_Viability_Ratio' in df_filtered.columns:
-    viable_pct = (df_filtered['Reskilling_Viability_Ratio'] >= 1).sum() / len(df_filtered) * 100
+if 'Reskilling_Viability_Ratio' in schema:
+    viability_ratio = df_filtered['Reskilling_Viability_Ratio'].to_numpy(dtype=float, na_value=np.nan)
+    viable_pct = np.count_nonzero(viability_ratio >= 1) * 100.0 / viability_ratio.size if viability_ratio.size else np.nan
     col4.metric(
         label="Reskilling Viable",
         value=f"{viable_pct:.1f}%",
@@ -273,79 +691,57 @@ st.markdown('<p class="section-header">3. Core Analytical Perspectives</p>', uns
 # ============================================================================
 # VISUALIZATION 1: Skill Half-Life Distribution by Category
 # ============================================================================
-if 'Skill_Category' in df_filtered.columns and 'Years_to_50_Percent_Obsolescence' in df_filtered.columns:
+@st.fragment
+def render_half_life_distribution(filter_key):
+    """
+    Render Visualization 3.1: skill half-life distribution by domain.
+    """
     st.markdown("### 3.1 Skill Obsolescence Velocity by Domain")
     st.markdown("**Research Question:** Which skill domains exhibit the most rapid depreciation?")
     
-    fig1 = px.box(
-        df_filtered,
-        x='Skill_Category',
-        y='Years_to_50_Percent_Obsolescence',
-        color='Skill_Category',
-        color_discrete_sequence=px.colors.qualitative.Bold,
-        title="Skill Half-Life Distribution Across Domains",
-        labels={'Years_to_50_Percent_Obsolescence': 'Years to 50% Obsolescence', 'Skill_Category': 'Skill Domain'},
-        template='plotly_dark'
-    )
-    fig1.update_layout(
-        showlegend=False,
-        height=500,
-        xaxis_tickangle=-45,
-        title_font_size=18,
-        font=dict(size=12)
-    )
-    fig1.add_hline(y=5, line_dash="dash", line_color="red", 
-                   annotation_text="Critical Threshold (5 years)", annotation_position="right")
-    st.plotly_chart(fig1, use_container_width=True)
+    st.plotly_chart(get_figure(build_half_life_distribution_figure, filter_key), use_container_width=True)
     
     st.markdown("""
     **Why This Matters:** Domains below the 5-year threshold require fundamentally different educational models. 
     Traditional degree programs (4 years) may produce graduates with partially obsolete skills before graduation.
     """)
 
+if 'Skill_Category' in schema and 'Years_to_50_Percent_Obsolescence' in schema:
+    render_half_life_distribution(filter_key)
+
 # ============================================================================
 # VISUALIZATION 2: AI Adoption vs Skill Depreciation
 # ============================================================================
-if 'AI_Adoption_Rate' in df_filtered.columns and 'Skill_Depreciation_Rate' in df_filtered.columns:
+@st.fragment
+def render_adoption_impact(filter_key):
+    """
+    Render Visualization 3.2: AI adoption impact on skill decay.
+    """
     st.markdown("---")
     st.markdown("### 3.2 AI Adoption Impact on Skill Decay")
     st.markdown("**Research Question:** Does AI adoption directly accelerate skill obsolescence?")
     
-    # Color by sector or category if available
-    color_col = None
-    if 'Sector' in df_filtered.columns:
-        color_col = 'Sector'
-    elif 'Skill_Category' in df_filtered.columns:
-        color_col = 'Skill_Category'
+    st.plotly_chart(get_figure(build_adoption_impact_figure, filter_key), use_container_width=True)
     
-    fig2 = px.scatter(
-        df_filtered,
-        x='AI_Adoption_Rate',
-        y='Skill_Depreciation_Rate',
-        color=color_col,
-        size='Acceleration_Index' if 'Acceleration_Index' in df_filtered.columns else None,
-        hover_data=df_filtered.columns.tolist(),
-        color_discrete_sequence=px.colors.qualitative.Vivid,
-        title="AI Adoption Rate vs. Skill Depreciation Dynamics",
-        labels={'AI_Adoption_Rate': 'AI Adoption Rate (%)', 'Skill_Depreciation_Rate': 'Skill Depreciation Rate'},
-        template='plotly_dark',
-        trendline="ols"
-    )
-    fig2.update_layout(height=550, title_font_size=18)
-    st.plotly_chart(fig2, use_container_width=True)
+    correlation = compute_adoption_statistics(*filter_key)[-1]
     
-    # Calculate correlation
-    correlation = df_filtered['AI_Adoption_Rate'].corr(df_filtered['Skill_Depreciation_Rate'])
     st.markdown(f"""
     **Statistical Insight:** Correlation coefficient = {correlation:.3f}  
     A strong positive correlation suggests AI adoption is a primary driver of skill obsolescence, not merely correlated 
     with other technological change. This challenges assumptions that AI will augment rather than replace human expertise.
     """)
 
+if 'AI_Adoption_Rate' in schema and 'Skill_Depreciation_Rate' in schema:
+    render_adoption_impact(filter_key)
+
 # ============================================================================
 # VISUALIZATION 3: Urgency Heatmap
 # ============================================================================
-if 'Urgency_Category' in df_filtered.columns:
+@st.fragment
+def render_urgency_profile(filter_key):
+    """
+    Render Visualization 3.3: obsolescence urgency profile.
+    """
     st.markdown("---")
     st.markdown("### 3.3 Skill Obsolescence Urgency Profile")
     st.markdown("**Research Question:** What is the distribution of intervention urgency?")
@@ -353,32 +749,7 @@ if 'Urgency_Category' in df_filtered.columns:
     col1, col2 = st.columns([2, 1])
     
     with col1:
-        urgency_counts = df_filtered['Urgency_Category'].value_counts().reset_index()
-        urgency_counts.columns = ['Urgency_Category', 'Count']
-        
-        # Define color mapping for urgency
-        color_map = {
-            'Critical (<2y)': '#f44336',
-            'High (2-5y)': '#ff9800',
-            'Moderate (5-10y)': '#ffc107',
-            'Low (>10y)': '#4caf50'
-        }
-        urgency_counts['Color'] = urgency_counts['Urgency_Category'].map(color_map)
-        
-        fig3 = px.bar(
-            urgency_counts,
-            x='Urgency_Category',
-            y='Count',
-            color='Urgency_Category',
-            color_discrete_map=color_map,
-            title="Distribution of Skill Obsolescence Urgency",
-            labels={'Urgency_Category': 'Urgency Level', 'Count': 'Number of Skills'},
-            template='plotly_dark',
-            text='Count'
-        )
-        fig3.update_layout(showlegend=False, height=450, title_font_size=18)
-        fig3.update_traces(textposition='outside')
-        st.plotly_chart(fig3, use_container_width=True)
+        st.plotly_chart(get_figure(build_urgency_figure, filter_key), use_container_width=True)
     
     with col2:
         st.markdown("#### Urgency Threshold Definitions")
@@ -396,36 +767,22 @@ if 'Urgency_Category' in df_filtered.columns:
         Conventional human capital models still applicable.
         """)
 
+if 'Urgency_Category' in schema:
+    render_urgency_profile(filter_key)
+
 # ============================================================================
 # VISUALIZATION 4: Reskilling Viability Analysis
 # ============================================================================
-if 'Reskilling_Viability_Ratio' in df_filtered.columns and 'Skill_Category' in df_filtered.columns:
+@st.fragment
+def render_viability_analysis(filter_key):
+    """
+    Render Visualization 3.4: economic viability of reskilling by domain.
+    """
     st.markdown("---")
     st.markdown("### 3.4 Economic Viability of Reskilling by Domain")
     st.markdown("**Research Question:** Where is reskilling economically rational vs. futile?")
     
-    viability_by_category = df_filtered.groupby('Skill_Category').agg({
-        'Reskilling_Viability_Ratio': 'mean',
-        'Reskilling_Time_Months': 'mean',
-        'Years_to_50_Percent_Obsolescence': 'mean'
-    }).reset_index()
-    
-    fig4 = px.bar(
-        viability_by_category,
-        x='Skill_Category',
-        y='Reskilling_Viability_Ratio',
-        color='Reskilling_Viability_Ratio',
-        color_continuous_scale='RdYlGn',
-        title="Reskilling Viability Ratio by Skill Domain",
-        labels={'Reskilling_Viability_Ratio': 'Viability Ratio', 'Skill_Category': 'Skill Domain'},
-        template='plotly_dark',
-        text='Reskilling_Viability_Ratio'
-    )
-    fig4.update_traces(texttemplate='%{text:.2f}', textposition='outside')
-    fig4.update_layout(height=500, title_font_size=18, xaxis_tickangle=-45)
-    fig4.add_hline(y=1, line_dash="dash", line_color="white", 
-                   annotation_text="Viability Threshold (Ratio=1)", annotation_position="right")
-    st.plotly_chart(fig4, use_container_width=True)
+    st.plotly_chart(get_figure(build_viability_figure, filter_key), use_container_width=True)
     
     st.markdown("""
     **Interpretation:** Ratio >1 indicates reskilling completes before obsolescence (viable). Ratio <1 suggests 
@@ -433,80 +790,44 @@ if 'Reskilling_Viability_Ratio' in df_filtered.columns and 'Skill_Category' in d
     such as income support rather than retraining investment.
     """)
 
+if 'Reskilling_Viability_Ratio' in schema and 'Skill_Category' in schema:
+    render_viability_analysis(filter_key)
+
 # ============================================================================
 # VISUALIZATION 5: Temporal Trend Analysis
 # ============================================================================
-if 'Year' in df_filtered.columns and 'Years_to_50_Percent_Obsolescence' in df_filtered.columns:
+@st.fragment
+def render_temporal_trend(filter_key):
+    """
+    Render Visualization 3.5: temporal evolution of skill half-life.
+    """
     st.markdown("---")
     st.markdown("### 3.5 Temporal Evolution of Skill Half-Life")
     st.markdown("**Research Question:** Is skill obsolescence accelerating over time?")
     
-    temporal_trend = df_filtered.groupby('Year').agg({
-        'Years_to_50_Percent_Obsolescence': ['mean', 'median', 'std']
-    }).reset_index()
-    temporal_trend.columns = ['Year', 'Mean', 'Median', 'Std']
-    
-    fig5 = go.Figure()
-    fig5.add_trace(go.Scatter(
-        x=temporal_trend['Year'], 
-        y=temporal_trend['Mean'],
-        mode='lines+markers',
-        name='Mean Half-Life',
-        line=dict(color='#64b5f6', width=3),
-        marker=dict(size=8)
-    ))
-    fig5.add_trace(go.Scatter(
-        x=temporal_trend['Year'], 
-        y=temporal_trend['Median'],
-        mode='lines+markers',
-        name='Median Half-Life',
-        line=dict(color='#81c784', width=3, dash='dash'),
-        marker=dict(size=8)
-    ))
-    
-    fig5.update_layout(
-        title="Skill Half-Life Trends Over Time",
-        xaxis_title="Year",
-        yaxis_title="Years to 50% Obsolescence",
-        template='plotly_dark',
-        height=500,
-        title_font_size=18,
-        hovermode='x unified'
-    )
-    st.plotly_chart(fig5, use_container_width=True)
+    st.plotly_chart(get_figure(build_temporal_trend_figure, filter_key), use_container_width=True)
     
     st.markdown("""
     **Why This Matters:** A declining trend indicates systemic acceleration in skill obsolescence, suggesting 
     current educational and workforce development systems are increasingly mismatched to labor market dynamics.
     """)
 
+if 'Year' in schema and 'Years_to_50_Percent_Obsolescence' in schema:
+    render_temporal_trend(filter_key)
+
 # ============================================================================
 # VISUALIZATION 6: Multi-Dimensional Comparative Analysis
 # ============================================================================
-if all(col in df_filtered.columns for col in ['AI_Adoption_Rate', 'Skill_Depreciation_Rate', 'Reskilling_Time_Months']):
+@st.fragment
+def render_risk_profile(filter_key):
+    """
+    Render Visualization 3.6: multi-dimensional risk profile.
+    """
     st.markdown("---")
     st.markdown("### 3.6 Multi-Dimensional Risk Profile")
     st.markdown("**Research Question:** Which combinations of factors create highest workforce vulnerability?")
     
-    fig6 = px.scatter_3d(
-        df_filtered,
-        x='AI_Adoption_Rate',
-        y='Skill_Depreciation_Rate',
-        z='Reskilling_Time_Months',
-        color='Urgency_Category' if 'Urgency_Category' in df_filtered.columns else None,
-        size='Years_to_50_Percent_Obsolescence',
-        hover_data=df_filtered.columns.tolist(),
-        color_discrete_sequence=px.colors.qualitative.Bold,
-        title="3D Risk Topology: AI Adoption × Depreciation × Reskilling Burden",
-        labels={
-            'AI_Adoption_Rate': 'AI Adoption Rate (%)',
-            'Skill_Depreciation_Rate': 'Depreciation Rate',
-            'Reskilling_Time_Months': 'Reskilling Time (months)'
-        },
-        template='plotly_dark'
-    )
-    fig6.update_layout(height=700, title_font_size=18)
-    st.plotly_chart(fig6, use_container_width=True)
+    st.plotly_chart(get_figure(build_risk_profile_figure, filter_key), use_container_width=True)
     
     st.markdown("""
     **Strategic Insight:** Skills in the upper-right-back octant (high AI adoption, high depreciation, long reskilling) 
@@ -514,6 +835,9 @@ if all(col in df_filtered.columns for col in ['AI_Adoption_Rate', 'Skill_Depreci
     approaches are insufficient.
     """)
 
+if schema.issuperset(['AI_Adoption_Rate', 'Skill_Depreciation_Rate', 'Reskilling_Time_Months']):
+    render_risk_profile(filter_key)
+
 # ============================================================================
 # SECTION 4: INSIGHT SYNTHESIS
 # ============================================================================
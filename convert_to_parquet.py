@@ -0,0 +1,24 @@
+"""
+One-time preprocessing step: convert the raw CSV dataset to Parquet.
+
+The dashboard loads 'skill_half_life_ai.parquet' when present, skipping CSV parsing on
+every cold start. Re-run this script whenever 'skill_half_life_ai.csv' is updated.
+
+Usage:
+    python convert_to_parquet.py
+"""
+
+import pandas as pd
+
+CSV_PATH = 'skill_half_life_ai.csv'
+PARQUET_PATH = 'skill_half_life_ai.parquet'
+
+
+def main():
+    df = pd.read_csv(CSV_PATH)
+    df.to_parquet(PARQUET_PATH, compression='zstd', index=False)
+    print(f"Wrote {len(df)} records from '{CSV_PATH}' to '{PARQUET_PATH}'")
+
+
+if __name__ == '__main__':
+    main()